@@ -2,22 +2,21 @@
 
 import argparse
 import cloudscraper
-import json
 import logging
+import orjson
 import os
 import re
-import requests
-import string
 import subprocess
 import sys
 import tempfile
 
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from functools import lru_cache
-
-import pandas as pd
-
-from tabulate import tabulate
+from itertools import groupby
+from urllib.parse import quote, urlencode
+from urllib3.util import Retry
 
 
 # bugzilla.mozilla.org
@@ -33,6 +32,73 @@ BMO_QUERY_TYPES = [
     "dataloss",
 ]
 
+# BMO query type -> search parameters added to the common bmo_url() filters
+BMO_QUERY_PARAMS = {
+    "regression-all": [
+        ("keywords", "regression"),
+        ("keywords_type", "allwords"),
+    ],
+    "regression-severe": [
+        ("keywords", "regression"),
+        ("keywords_type", "allwords"),
+        ("bug_severity", "S1"),
+        ("bug_severity", "critical"),
+        ("bug_severity", "S2"),
+        ("bug_severity", "major"),
+        ("o1", "nowordssubstr"),
+        ("o2", "nowordssubstr"),
+    ],
+    "non-regression-all": [
+        ("keywords", "regression"),
+        ("keywords_type", "nowords"),
+        ("o1", "nowordssubstr"),
+        ("o2", "nowordssubstr"),
+    ],
+    "non-regression-severe": [
+        ("keywords", "regression"),
+        ("keywords_type", "nowords"),
+        ("bug_severity", "S1"),
+        ("bug_severity", "critical"),
+        ("bug_severity", "S2"),
+        ("bug_severity", "major"),
+        ("o1", "nowordssubstr"),
+        ("o2", "nowordssubstr"),
+    ],
+    "topcrash": [
+        ("keywords", "topcrash-thunderbird"),
+        ("keywords_type", "allwords"),
+        ("o1", "nowordssubstr"),
+        ("o2", "nowordssubstr"),
+    ],
+    "perf": [
+        ("keywords", "perf"),
+        ("keywords_type", "allwords"),
+        ("o1", "nowordssubstr"),
+        ("o2", "nowordssubstr"),
+    ],
+    "sec-crit-high": [
+        ("keywords", "sec-crit sec-high"),
+        ("keywords_type", "anywords"),
+        ("o1", "nowordssubstr"),
+        ("o2", "nowordssubstr"),
+    ],
+    "sec-moderate-low": [
+        ("keywords", "sec-moderate sec-low"),
+        ("keywords_type", "anywords"),
+        ("o1", "nowordssubstr"),
+        ("o2", "nowordssubstr"),
+    ],
+    "dataloss": [
+        ("keywords", "dataloss"),
+        ("keywords_type", "allwords"),
+        ("o1", "nowordssubstr"),
+        ("o2", "nowordssubstr"),
+    ],
+}
+
+# Prefix of the per-version Thunderbird status fields on BMO bugs
+BMO_STATUS_FIELD_PREFIX = "cf_status_thunderbird_"
+
 # stats.thunderbird.net
 STN_QUERY_TYPES = [
     "daily-adi",
@@ -42,6 +108,10 @@ STN_QUERY_TYPES = [
     "esr140-adi",
 ]
 
+# Stable release versions are purely numeric, e.g. 140.3.1; alpha and beta
+# versions carry an a/b suffix, e.g. 145.0a1 or 144.0b3
+STABLE_VERSION_RE = re.compile(r"\d+(?:\.\d+)*")
+
 # crash-stats.mozilla.org
 CSMO_QUERY_TYPES = [
     "release-crashes",
@@ -56,37 +126,145 @@ INCLUDE_PREVIOUS_RELEASES = 0
 ESR_NEXT = False
 INCLUDE_115 = False
 
-scraper = cloudscraper.create_scraper()
+# xlsxwriter cell formats for the exported spreadsheet: the "url" formats are
+# used on the Query URLs sheet, the rest on the Data from Queries sheet
+SPREADSHEET_FORMATS = {
+    "url_header": {
+        "bg_color": "#B0B3B2",
+        "align": "center",
+        "font_name": "Arial",
+        "font_size": 10,
+    },
+    "url": {
+        "font_color": "#0000FF",
+        "underline": 1,
+        "font_name": "Arial",
+        "font_size": 10,
+    },
+    "header": {
+        "bg_color": "#B0B3B2",
+        "align": "center",
+        "font_name": "Helvetica Neue",
+        "font_size": 10,
+        "text_wrap": True,
+    },
+    "date": {
+        "bg_color": "#D4D4D4",
+        "align": "center",
+        "font_name": "Helvetica Neue",
+        "font_size": 10,
+    },
+    "percentage": {
+        "num_format": "0.00%",
+        "align": "center",
+        "font_name": "Helvetica Neue",
+        "font_size": 10,
+    },
+    "other": {
+        "align": "center",
+        "font_name": "Helvetica Neue",
+        "font_size": 10,
+    },
+}
+
+# Upper bound on concurrent HTTP queries issued by main()
+QUERY_WORKERS = 16
+
+# Upper bound on concurrent connections to any one host, so the BMO and
+# crash-stats APIs are not hit with every query at once
+HOST_CONNECTIONS = 4
+
+# How long --http-cache keeps responses; the metrics only change daily
+HTTP_CACHE_EXPIRY = timedelta(hours=1)
+
+
+def create_scraper(cache=False):
+    """Create the cloudscraper session shared by all queries
+
+    With cache=True, GET responses are stored on disk by requests-cache and
+    reused for HTTP_CACHE_EXPIRY, so repeated runs skip the network.
+    """
+    scraper_class = cloudscraper.CloudScraper
+    cache_options = {}
+    if cache:
+        try:
+            from requests_cache import CacheMixin
+        except ImportError:
+            sys.exit("--http-cache requires requests-cache. Please install it.")
+        scraper_class = type(
+            "CachedCloudScraper", (CacheMixin, cloudscraper.CloudScraper), {}
+        )
+        cache_options = {
+            "cache_name": "thunderbird_metrics",
+            "use_cache_dir": True,
+            "expire_after": HTTP_CACHE_EXPIRY,
+        }
+
+    scraper = scraper_class.create_scraper(**cache_options)
+    # Reuse up to HOST_CONNECTIONS keep-alive connections per host, making
+    # further concurrent queries wait for one rather than open more, and keep
+    # the cipher suite cloudscraper picked for its own adapter. Transient
+    # server errors are retried with backoff rather than failing the whole
+    # run; 503 is left to cloudscraper, which uses it for challenges.
+    scraper.mount(
+        "https://",
+        cloudscraper.CipherSuiteAdapter(
+            cipherSuite=scraper.cipherSuite,
+            ecdhCurve=scraper.ecdhCurve,
+            pool_connections=8,
+            pool_maxsize=HOST_CONNECTIONS,
+            pool_block=True,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=(500, 502, 504),
+            ),
+        ),
+    )
+    return scraper
+
+
+scraper = create_scraper()
 
 
 @lru_cache
 def current_thunderbird_versions():
     url = "https://product-details.mozilla.org/1.0/thunderbird_versions.json"
     response = scraper.get(url)
-    data = response.json()
+    data = orjson.loads(response.content)
     return data
 
 
+@lru_cache
+def thunderbird_adi_data():
+    """Get the thunderbird_adi.json document from stats.thunderbird.net"""
+    r = scraper.get("https://stats.thunderbird.net/thunderbird_adi.json")
+    return orjson.loads(r.content)
+
+
+@lru_cache
+def thunderbird_major_version(key):
+    """Get the major version of a product-details version entry"""
+    return current_thunderbird_versions()[key].split(".")[0]
+
+
 @lru_cache
 def thunderbird_esr_major_version():
-    thunderbird_versions = current_thunderbird_versions()
-    version = thunderbird_versions["THUNDERBIRD_ESR"].split(".")[0]
     if ESR_NEXT:
-        version = thunderbird_versions["THUNDERBIRD_ESR_NEXT"].split(".")[0]
-    return version
+        return thunderbird_major_version("THUNDERBIRD_ESR_NEXT")
+    return thunderbird_major_version("THUNDERBIRD_ESR")
 
 
 @lru_cache
 def thunderbird_status_versions():
-    thunderbird_versions = current_thunderbird_versions()
     status_version_start = thunderbird_esr_major_version()
-    status_version_end = thunderbird_versions[
+    status_version_end = thunderbird_major_version(
         "LATEST_THUNDERBIRD_NIGHTLY_VERSION"
-    ].split(".")[0]
+    )
     thunderbird_status_versions = [
-        f"cf_status_thunderbird_esr{status_version_start}"
+        f"{BMO_STATUS_FIELD_PREFIX}esr{status_version_start}"
     ] + [
-        f"cf_status_thunderbird_{index}"
+        f"{BMO_STATUS_FIELD_PREFIX}{index}"
         for index in range(int(status_version_start), int(status_version_end) + 1)
     ]
     return thunderbird_status_versions
@@ -107,8 +285,7 @@ def thunderbird_daily_versions():
 
 @lru_cache
 def thunderbird_beta_versions():
-    thunderbird_versions = current_thunderbird_versions()
-    beta = thunderbird_versions["LATEST_THUNDERBIRD_DEVEL_VERSION"].split(".")[0]
+    beta = thunderbird_major_version("LATEST_THUNDERBIRD_DEVEL_VERSION")
     thunderbird_beta_versions = [f"{beta}.0b{index}" for index in range(1, 7)]
     if INCLUDE_PREVIOUS_BETA:
         previous_beta = f"{int(beta.split('.')[0]) - 1}"
@@ -120,8 +297,7 @@ def thunderbird_beta_versions():
 
 @lru_cache
 def thunderbird_release_versions():
-    thunderbird_versions = current_thunderbird_versions()
-    release = thunderbird_versions["LATEST_THUNDERBIRD_VERSION"].split(".")[0]
+    release = thunderbird_major_version("LATEST_THUNDERBIRD_VERSION")
     thunderbird_release_versions = [f"{release}.0"] + [
         f"{release}.0.{index}" for index in range(1, 4)
     ]
@@ -148,16 +324,14 @@ def thunderbird_current_daily_version():
 @lru_cache
 def thunderbird_current_beta_versions():
     """Get only the current beta versions (no previous versions)"""
-    thunderbird_versions = current_thunderbird_versions()
-    beta = thunderbird_versions["LATEST_THUNDERBIRD_DEVEL_VERSION"].split(".")[0]
+    beta = thunderbird_major_version("LATEST_THUNDERBIRD_DEVEL_VERSION")
     return [f"{beta}.0b{index}" for index in range(1, 7)]
 
 
 @lru_cache
 def thunderbird_current_release_versions():
     """Get only the current release versions (no previous versions)"""
-    thunderbird_versions = current_thunderbird_versions()
-    release = thunderbird_versions["LATEST_THUNDERBIRD_VERSION"].split(".")[0]
+    release = thunderbird_major_version("LATEST_THUNDERBIRD_VERSION")
     return [f"{release}.0"] + [f"{release}.0.{index}" for index in range(1, 4)]
 
 @lru_cache
@@ -167,19 +341,16 @@ def thunderbird_current_esr140_versions():
     if not all_esr140_versions:
         return []
 
-    # Group versions by minor version (major.minor)
-    minor_versions = {}
+    # Group versions by minor version, keyed by (major, minor) as integers
+    minor_versions = defaultdict(list)
     for version in all_esr140_versions:
         parts = version.split(".")
         if len(parts) >= 2:
-            minor_key = f"{parts[0]}.{parts[1]}"
-            if minor_key not in minor_versions:
-                minor_versions[minor_key] = []
-            minor_versions[minor_key].append(version)
+            minor_versions[(int(parts[0]), int(parts[1]))].append(version)
 
     # Get the latest minor version
     if minor_versions:
-        latest_minor = max(minor_versions.keys(), key=lambda x: tuple(map(int, x.split("."))))
+        latest_minor = max(minor_versions)
         return sorted(minor_versions[latest_minor])
 
     return []
@@ -187,8 +358,7 @@ def thunderbird_current_esr140_versions():
 @lru_cache
 def thunderbird_esr_versions(major_version):
     """Get all ESR versions for a given major version from thunderbird_adi.json"""
-    r = scraper.get("https://stats.thunderbird.net/thunderbird_adi.json")
-    data = json.loads(r.text)
+    data = thunderbird_adi_data()
 
     latest_date = max(data.keys())
     versions_data = data[latest_date].get("versions", {})
@@ -201,8 +371,8 @@ def thunderbird_esr_versions(major_version):
             # Ensure it's an ESR-like version (x.y.z format)
             parts = version.split(".")
             if len(parts) >= 2 and parts[0] == major_str:
-                # Filter out alpha/beta versions (those containing 'a' or 'b')
-                if 'a' not in version and 'b' not in version:
+                # Filter out alpha/beta versions (e.g. 140.0a1, 140.0b2)
+                if STABLE_VERSION_RE.fullmatch(version):
                     esr_versions.append(version)
 
     return sorted(esr_versions)
@@ -214,8 +384,7 @@ def thunderbird_esr_count(major_version):
 
     Special case: When major_version is "115", includes all ESR versions <= 115
     """
-    r = scraper.get("https://stats.thunderbird.net/thunderbird_adi.json")
-    data = json.loads(r.text)
+    data = thunderbird_adi_data()
 
     yesterday_data = data[yesterday()]
     versions_data = yesterday_data.get("versions", {})
@@ -227,8 +396,8 @@ def thunderbird_esr_count(major_version):
         target_major = int(major_version)
 
         for version in versions_data.keys():
-            # Check if it's a stable release (no 'a' or 'b')
-            if 'a' not in version and 'b' not in version:
+            # Check if it's a stable release (no alpha/beta suffix)
+            if STABLE_VERSION_RE.fullmatch(version):
                 try:
                     version_parts = version.split(".")
                     if len(version_parts) >= 2:
@@ -252,293 +421,174 @@ def thunderbird_esr_count(major_version):
 
 def stn_current_query(query_type):
     """Query stats.thunderbird.net for current versions only"""
-    r = scraper.get("https://stats.thunderbird.net/thunderbird_adi.json")
+    versions_data = thunderbird_adi_data()[yesterday()]["versions"]
     count = 0
 
     if query_type == "current-daily-adi":
         for version in thunderbird_current_daily_version():
-            if version in json.loads(r.text)[yesterday()]["versions"]:
-                count += json.loads(r.text)[yesterday()]["versions"][version]
+            count += versions_data.get(version, 0)
     elif query_type == "current-beta-adi":
-        for version in thunderbird_current_beta_versions():
-            if "0b1" not in version:
-                continue
-            version = thunderbird_current_beta_versions()[0].split("b")[0]
-            if version in json.loads(r.text)[yesterday()]["versions"]:
-                count += json.loads(r.text)[yesterday()]["versions"][version]
+        # Beta ADI is reported under the major version, e.g. 144.0
+        version = thunderbird_current_beta_versions()[0].split("b")[0]
+        count = versions_data.get(version, 0)
     elif query_type == "current-release-adi":
         for version in thunderbird_current_release_versions():
-            if version in json.loads(r.text)[yesterday()]["versions"]:
-                count += json.loads(r.text)[yesterday()]["versions"][version]
-
-    return count
-
-
-def csmo_current_query(query_type):
-    """Query crash-stats.mozilla.org for current versions only"""
-    versions = ""
-
-    if query_type == "current-daily-crashes":
-        for version in thunderbird_current_daily_version():
-            versions = f"{versions}version={version}&"
-    elif query_type == "current-beta-crashes":
-        for version in thunderbird_current_beta_versions():
-            versions = f"{versions}version={version}&"
-    elif query_type == "current-release-crashes":
-        for version in thunderbird_current_release_versions():
-            versions = f"{versions}version={version}&"
+            count += versions_data.get(version, 0)
 
-    today_formatted = today()
-    yesterday_formatted = yesterday()
-    start_date = f"date=>={yesterday_formatted}T00:00:00.000Z&"
-    end_date = f"date=<{today_formatted}T00:00:00.000Z&"
-
-    url_base = "https://crash-stats.mozilla.org/api/SuperSearch/?product=Thunderbird&"
-    url = f"{url_base}{versions}{start_date}{end_date}_facets=platform&_facets=release_channel"
-    r = scraper.get(url)
-    count = json.loads(r.text)["total"]
     return count
 
 
-def csmo_current_esr140_query():
-    """Query crash-stats.mozilla.org for current ESR 140 minor version only"""
-    versions = ""
-
-    for version in thunderbird_current_esr140_versions():
-        version_with_esr = f"{version}esr"
-        versions = f"{versions}version={version_with_esr}&"
-
-    today_formatted = today()
-    yesterday_formatted = yesterday()
-    start_date = f"date=>={yesterday_formatted}T00:00:00.000Z&"
-    end_date = f"date=<{today_formatted}T00:00:00.000Z&"
-
-    url_base = "https://crash-stats.mozilla.org/api/SuperSearch/?product=Thunderbird&"
-    url = f"{url_base}{versions}{start_date}{end_date}_facets=platform&_facets=release_channel"
-
-    r = scraper.get(url)
-    count = json.loads(r.text)["total"]
-    return count
+@lru_cache
+def run_datetime():
+    """Get the time of this run, so every date used agrees on the day"""
+    return datetime.now()
 
 
 @lru_cache
 def today():
     """Get today's date in YYYY-MM-DD format"""
-    today = datetime.now()
+    today = run_datetime()
     return today.strftime("%Y-%m-%d")
 
 
 @lru_cache
 def yesterday():
     """Get yesterday's date in YYYY-MM-DD format"""
-    today = datetime.now()
+    today = run_datetime()
     yesterday = today - timedelta(days=1)
     return yesterday.strftime("%Y-%m-%d")
 
 
+@lru_cache
+def bmo_common_params():
+    """Get the bugzilla.mozilla.org search parameters shared by every query"""
+    status_versions = thunderbird_status_versions()
+    status_indexes = range(4, 4 + len(status_versions))
+
+    params = [
+        ("bug_type", "defect"),
+        ("chfield", "[Bug creation]"),
+        ("f1", "short_desc"),
+        ("f2", "component"),
+        ("f3", "OP"),
+    ]
+    params += [
+        (f"f{index}", version)
+        for index, version in zip(status_indexes, status_versions)
+    ]
+    params += [(f"f{status_indexes.stop}", "CP"), ("j3", "OR")]
+    params += [(f"o{index}", "equals") for index in status_indexes]
+    params += [
+        ("resolution", "---"),
+        ("v1", "intermit perma assert debug ews"),
+        ("v2", " add-on build upstream"),
+    ]
+    params += [(f"v{index}", "affected") for index in status_indexes]
+    return tuple(params)
+
+
+@lru_cache
 def bmo_url(query_type, rest_url=True):
     """Get bugzilla.mozilla.org URL"""
-    index = 4
-    f_version = ""
-    o_comparison = ""
-    v_status = ""
-    for version in thunderbird_status_versions():
-        f_version = f"{f_version}f{index}={version}&"
-        o_comparison = f"{o_comparison}o{index}=equals&"
-        v_status = f"{v_status}v{index}=affected&"
-        index += 1
-    f_version = f"{f_version}f{index}=CP&"
-
     if rest_url:
-        url_base = (
-            "https://bugzilla.mozilla.org/rest/bug?include_fields=id,summary,status&"
-        )
+        url_base = "https://bugzilla.mozilla.org/rest/bug"
+        params = [("count_only", "1")]
     else:
-        url_base = "https://bugzilla.mozilla.org/buglist.cgi?"
-
-    url = (
-        f"{url_base}"
-        "bug_type=defect&"
-        "chfield=%5BBug%20creation%5D&"
-        "f1=short_desc&"
-        "f2=component&"
-        "f3=OP&"
-        f"{f_version}"
-        "j3=OR&"
-        f"{o_comparison}"
-        "resolution=---&"
-        "v1=intermit%20perma%20assert%20debug%20ews&"
-        "v2=%20add-on%20build%20upstream&"
-        f"{v_status}"
-    )
+        url_base = "https://bugzilla.mozilla.org/buglist.cgi"
+        params = []
 
-    match query_type:
-        case "sec-crit-high":
-            url = (
-                f"{url}"
-                "keywords=sec-crit%20sec-high&"
-                "keywords_type=anywords&"
-                "o1=nowordssubstr&"
-                "o2=nowordssubstr&"
-            )
-        case "sec-moderate-low":
-            url = (
-                f"{url}"
-                "keywords=sec-moderate%20sec-low&"
-                "keywords_type=anywords&"
-                "o1=nowordssubstr&"
-                "o2=nowordssubstr&"
-            )
-        case "regression-all":
-            url = f"{url}" "keywords=regression&" "keywords_type=allwords&"
-        case "regression-severe":
-            url = (
-                f"{url}"
-                "keywords=regression&"
-                "keywords_type=allwords&"
-                "bug_severity=S1&"
-                "bug_severity=critical&"
-                "bug_severity=S2&"
-                "bug_severity=major&"
-                "o1=nowordssubstr&"
-                "o2=nowordssubstr&"
-            )
-        case "non-regression-all":
-            url = (
-                f"{url}"
-                "keywords=regression&"
-                "keywords_type=nowords&"
-                "o1=nowordssubstr&"
-                "o2=nowordssubstr&"
-            )
-        case "non-regression-severe":
-            url = (
-                f"{url}"
-                "keywords=regression&"
-                "keywords_type=nowords&"
-                "bug_severity=S1&"
-                "bug_severity=critical&"
-                "bug_severity=S2&"
-                "bug_severity=major&"
-                "o1=nowordssubstr&"
-                "o2=nowordssubstr&"
-            )
-        case "perf":
-            url = (
-                f"{url}"
-                "keywords=perf&"
-                "keywords_type=allwords&"
-                "o1=nowordssubstr&"
-                "o2=nowordssubstr&"
-            )
-        case "topcrash":
-            url = (
-                f"{url}"
-                "keywords=topcrash-thunderbird&"
-                "keywords_type=allwords&"
-                "o1=nowordssubstr&"
-                "o2=nowordssubstr&"
-            )
-        case "dataloss":
-            url = (
-                f"{url}"
-                "keywords=dataloss&"
-                "keywords_type=allwords&"
-                "o1=nowordssubstr&"
-                "o2=nowordssubstr&"
-            )
-        case _:
-            sys.exit(f"Unknown query type: {query_type}")
+    params += bmo_common_params()
+
+    if query_type not in BMO_QUERY_PARAMS:
+        sys.exit(f"Unknown query type: {query_type}")
+    params += BMO_QUERY_PARAMS[query_type]
+
+    return f"{url_base}?{urlencode(params, quote_via=quote)}"
+
+
+# ESR major version -> function returning its current minor versions, whose
+# crashes are reported against the ADI of every version of that ESR
+ESR_CURRENT_VERSIONS = {
+    "140": thunderbird_current_esr140_versions,
+}
 
-    return url
 
+# CSMO query type -> (function returning the versions to search, suffix that
+# crash-stats appends to those versions)
+CSMO_QUERY_VERSIONS = {
+    "daily-crashes": (thunderbird_current_daily_version, ""),
+    "beta-crashes": (thunderbird_current_beta_versions, ""),
+    "release-crashes": (thunderbird_current_release_versions, ""),
+    "esr140-crashes": (thunderbird_current_esr140_versions, "esr"),
+}
 
+
+@lru_cache
 def csmo_url(query_type, rest_url=True):
     """Get crash-stats.mozilla.org URL"""
-    versions = ""
-    match query_type:
-        case "daily-crashes":
-            for version in thunderbird_current_daily_version():
-                versions = f"{versions}version={version}&"
-        case "beta-crashes":
-            for version in thunderbird_current_beta_versions():
-                versions = f"{versions}version={version}&"
-        case "release-crashes":
-            for version in thunderbird_current_release_versions():
-                versions = f"{versions}version={version}&"
-        case "esr140-crashes":
-            for version in thunderbird_current_esr140_versions():
-                version = f"{version}esr"
-                versions = f"{versions}version={version}&"
-
-    today_formatted = today()
-    yesterday_formatted = yesterday()
-    start_date = f"date=>={yesterday_formatted}T00:00:00.000Z&"
-    end_date = f"date=<{today_formatted}T00:00:00.000Z&"
+    versions = []
+    if query_type in CSMO_QUERY_VERSIONS:
+        versions_function, suffix = CSMO_QUERY_VERSIONS[query_type]
+        versions = [f"{version}{suffix}" for version in versions_function()]
+
+    params = [("product", "Thunderbird")]
+    params += [("version", version) for version in versions]
+    params += [
+        ("date", f">={yesterday()}T00:00:00.000Z"),
+        ("date", f"<{today()}T00:00:00.000Z"),
+        ("_facets", "platform"),
+        ("_facets", "release_channel"),
+    ]
 
     if rest_url:
-        url_base = (
-            "https://crash-stats.mozilla.org/api/SuperSearch/?product=Thunderbird&"
-        )
+        url_base = "https://crash-stats.mozilla.org/api/SuperSearch/"
+        fragment = ""
     else:
-        url_base = "https://crash-stats.mozilla.org/search/?product=Thunderbird&"
-
-    url = f"{url_base}" f"{versions}" f"{start_date}" f"{end_date}" "_facets=platform&"
+        url_base = "https://crash-stats.mozilla.org/search/"
+        fragment = "#facet-release_channel"
+        params += [("_sort", "-date")]
+        params += [
+            ("_columns", column)
+            for column in ("date", "signature", "product", "version", "build_id", "platform")
+        ]
 
-    if rest_url:
-        url = f"{url}" "_facets=release_channel"
-    else:
-        url = (
-            f"{url}"
-            "_facets=release_channel&"
-            "_sort=-date&"
-            "_columns=date&"
-            "_columns=signature&"
-            "_columns=product&"
-            "_columns=version&"
-            "_columns=build_id&"
-            "_columns=platform#facet-release_channel"
-        )
-    return url
+    return f"{url_base}?{urlencode(params, quote_via=quote)}{fragment}"
 
 
-def bmo_query(query_type):
-    """Query bugzilla.mozilla.org"""
+def bmo_query(url):
+    """Query bugzilla.mozilla.org for the number of bugs matching a REST URL"""
     api_key = os.getenv("BMO_API_KEY")
     if not api_key:
         sys.exit("BMO_API_KEY is empty. Please export your BMO key.")
     headers = {"Content-type": "application/json"}
     params = {"api_key": api_key}
 
-    r = scraper.get(bmo_url(query_type), headers=headers, params=params)
-    count = len(json.loads(r.text)["bugs"])
+    r = scraper.get(url, headers=headers, params=params)
+    count = orjson.loads(r.content)["bug_count"]
     return count
 
 
 def stn_query(query_type):
     """Query stats.thunderbird.net"""
-    r = scraper.get("https://stats.thunderbird.net/thunderbird_adi.json")
+    adi = thunderbird_adi_data()[yesterday()]
+    versions_data = adi["versions"]
     match query_type:
         case "total-adi":
-            count = json.loads(r.text)[yesterday()]["count"]
+            count = adi["count"]
         case "daily-adi":
-            count = 0
-            for version in thunderbird_daily_versions():
-                if version in json.loads(r.text)[yesterday()]["versions"]:
-                    count += json.loads(r.text)[yesterday()]["versions"][version]
+            count = sum(
+                versions_data.get(version, 0)
+                for version in thunderbird_daily_versions()
+            )
         case "beta-adi":
-            count = 0
-            for version in thunderbird_beta_versions():
-                if "0b1" not in version:
-                    continue
-                version = thunderbird_beta_versions()[0].split("b")[0]
-                if version in json.loads(r.text)[yesterday()]["versions"]:
-                    count += json.loads(r.text)[yesterday()]["versions"][version]
+            # Beta ADI is reported under the major version, e.g. 144.0
+            version = thunderbird_beta_versions()[0].split("b")[0]
+            count = versions_data.get(version, 0)
         case "release-adi":
-            count = 0
-            for version in thunderbird_release_versions():
-                if version in json.loads(r.text)[yesterday()]["versions"]:
-                    count += json.loads(r.text)[yesterday()]["versions"][version]
+            count = sum(
+                versions_data.get(version, 0)
+                for version in thunderbird_release_versions()
+            )
         case "esr140-adi":
             count = thunderbird_esr_count("140")
         case "esr128-adi":
@@ -550,131 +600,84 @@ def stn_query(query_type):
     return count
 
 
-def csmo_query(query_type):
-    """Query crash-stats.mozilla.org"""
-    r = scraper.get(csmo_url(query_type))
-    count = json.loads(r.text)["total"]
+def csmo_query(url):
+    """Query crash-stats.mozilla.org for the number of crashes at a REST URL"""
+    r = scraper.get(url)
+    count = orjson.loads(r.content)["total"]
     return count
 
 
 def print_versions():
-    affected_versions = re.sub(
-        "cf_status_thunderbird_", "", ", ".join(thunderbird_status_versions())
+    from tabulate import tabulate
+
+    affected_versions = ", ".join(
+        version.removeprefix(BMO_STATUS_FIELD_PREFIX)
+        for version in thunderbird_status_versions()
     )
     daily_versions = f"{', '.join(thunderbird_daily_versions())}"
     beta_versions = f"{', '.join(thunderbird_beta_versions())}"
     release_versions = f"{', '.join(thunderbird_release_versions())}"
-    esr140_versions = f"{', '.join(thunderbird_esr_versions(140))}"
-    table_data = {
-        "Category": [
-            "bugzilla affected versions",
-            "daily versions",
-            "beta versions",
-            "release versions",
-            "esr140 versions"
-        ],
-        "Variable": [
-            affected_versions,
-            daily_versions,
-            beta_versions,
-            release_versions,
-            esr140_versions,
-        ],
-    }
-    df = pd.DataFrame(table_data)
-    table_data = df.values.tolist()
+    esr140_versions = ", ".join(thunderbird_esr_versions("140"))
+    table_data = [
+        ["bugzilla affected versions", affected_versions],
+        ["daily versions", daily_versions],
+        ["beta versions", beta_versions],
+        ["release versions", release_versions],
+        ["esr140 versions", esr140_versions],
+    ]
     print(tabulate(table_data, tablefmt="plain", colalign=("left", "left")))
 
 
 def export_metrics_to_spreadsheet(release_readiness_metrics):
-    with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as temp_file:
-        metrics_df = pd.DataFrame(
-            [list(metrics["count"] for metrics in release_readiness_metrics.values())],
-            columns=list(release_readiness_metrics.keys()),
-        )
-        metrics_df.insert(0, "Date", [today()])
-        url_df = pd.DataFrame(
-            [
-                (metrics["text"], metrics["url"])
-                for key, metrics in release_readiness_metrics.items()
-                if "url" in metrics
-            ],
-            columns=["Description", "URL"],
-        )
-        with pd.ExcelWriter(temp_file.name, engine="xlsxwriter") as writer:
-
-            workbook = writer.book
+    import xlsxwriter
 
-            # formatting for sheet 1
-            font = "Arial"
-            font_size = 10
-            header_format = workbook.add_format(
-                {"bg_color": "#B0B3B2", "align": "center"}
-            )
-            header_format.set_font_name(font)
-            header_format.set_font_size(font_size)
-            link_format = workbook.add_format({"font_color": "#0000FF", "underline": 1})
-            link_format.set_font_name(font)
-            link_format.set_font_size(font_size)
-            column_width = 50
+    metrics_columns = ["Date"] + list(release_readiness_metrics.keys())
+    metrics_values = [today()] + [
+        metrics["count"] for metrics in release_readiness_metrics.values()
+    ]
+    metrics_urls = [
+        (metrics["text"], metrics["url"])
+        for metrics in release_readiness_metrics.values()
+        if "url" in metrics
+    ]
+    with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as temp_file:
+        # Rows are written strictly in order, so each can be flushed to disk
+        # as soon as the next one starts
+        with xlsxwriter.Workbook(
+            temp_file.name, {"constant_memory": True}
+        ) as workbook:
+            formats = {
+                name: workbook.add_format(spec)
+                for name, spec in SPREADSHEET_FORMATS.items()
+            }
 
             # write sheet 1
             sheet1 = workbook.add_worksheet("Release Metrics Charts")
-            sheet1.write(0, 0, "Query URLs", header_format)
-            for row_num, (
-                description,
-                url,
-            ) in enumerate(url_df.itertuples(index=False), start=1):
-                sheet1.write_url(row_num, 0, url, link_format, description)
-            sheet1.set_column(0, 0, column_width)
-
-            # formatting for sheet 2
-            font = "Helvetica Neue"
-            header_format = workbook.add_format(
-                {"bg_color": "#B0B3B2", "align": "center"}
-            )
-            header_format.set_font_name(font)
-            header_format.set_font_size(font_size)
-            header_format.set_text_wrap()
-            date_format = workbook.add_format(
-                {"bg_color": "#D4D4D4", "align": "center"}
+            sheet1.write(0, 0, "Query URLs", formats["url_header"])
+            for row_num, (description, url) in enumerate(metrics_urls, start=1):
+                sheet1.write_url(row_num, 0, url, formats["url"], description)
+            sheet1.set_column(0, 0, 50)
+
+            # column index -> format, by position (A=0) on sheet 2
+            column_formats = {0: formats["date"]} | dict.fromkeys(
+                (11, 14, 17, 19, 20, 21, 24, 26), formats["percentage"]
             )
-            date_format.set_font_name(font)
-            date_format.set_font_size(font_size)
-            percentage_format = workbook.add_format(
-                {"num_format": "0.00%", "align": "center"}
-            )
-            percentage_format.set_font_name(font)
-            percentage_format.set_font_size(font_size)
-            other_format = workbook.add_format({"align": "center"})
-            other_format.set_font_name(font)
-            other_format.set_font_size(font_size)
-
-            percentage_columns = ["L", "O", "R", "T", "U", "V", "Y", "AA"]
-            other_columns = list(
-                filter(
-                    lambda x: x not in percentage_columns, list(string.ascii_uppercase)
-                )
-            )
-            last_other_column = "Z"
             column_width = 12
 
             # write sheet 2
-            metrics_df.to_excel(writer, index=False, sheet_name="Data from Queries")
-            sheet2 = writer.sheets["Data from Queries"]
-            for col_num, col_name in enumerate(metrics_df.columns):
-                sheet2.write(0, col_num, col_name, header_format)
-                sheet2.set_column(col_num, col_num, column_width, header_format)
-            for column in percentage_columns:
-                sheet2.set_column(f"{column}:{column}", column_width, percentage_format)
-            for column in other_columns[
-                other_columns.index("A") : other_columns.index("A") + 1
-            ]:
-                sheet2.set_column(f"{column}:{column}", column_width, date_format)
-            for column in other_columns[
-                other_columns.index("B") : other_columns.index(last_other_column) + 1
-            ]:
-                sheet2.set_column(f"{column}:{column}", column_width, other_format)
+            sheet2 = workbook.add_worksheet("Data from Queries")
+            # one set_column call per run of adjacent columns sharing a format
+            column_runs = groupby(
+                range(len(metrics_columns)),
+                key=lambda col_num: column_formats.get(col_num, formats["other"]),
+            )
+            for column_format, col_nums in column_runs:
+                col_nums = list(col_nums)
+                sheet2.set_column(
+                    col_nums[0], col_nums[-1], column_width, column_format
+                )
+            sheet2.write_row(0, 0, metrics_columns, formats["header"])
+            sheet2.write_row(1, 0, metrics_values)
 
         try:
             subprocess.run(["xdg-open", temp_file.name], check=True)
@@ -686,12 +689,34 @@ def create_metrics_dict(keys_with_texts):
     return {key: {"text": text} for key, text in keys_with_texts}
 
 
+def safe_div(numerator, denominator):
+    """Divide, treating an empty denominator (e.g. no ADI yet) as a ratio of 0"""
+    return numerator / denominator if denominator > 0 else 0
+
+
+def set_adi_percentage(release_readiness_metrics, adi_key, total_adi):
+    """Store the share of total ADI for an ADI metric under its "-%" key"""
+    adi = release_readiness_metrics[adi_key]["count"]
+    percentage = safe_div(adi, total_adi)
+    release_readiness_metrics[f"{adi_key}-%"]["count"] = percentage
+    return adi, percentage
+
+
+def set_crash_rate(release_readiness_metrics, channel, adi):
+    """Store a channel's crashes per ADI under its "-crash-rate" key"""
+    crashes = release_readiness_metrics[f"{channel}-crashes"]["count"]
+    crash_rate = safe_div(crashes, adi)
+    release_readiness_metrics[f"{channel}-crash-rate"]["count"] = crash_rate
+    return crashes, crash_rate
+
+
 def main():
     global INCLUDE_PREVIOUS_DAILIES
     global INCLUDE_PREVIOUS_BETA
     global INCLUDE_PREVIOUS_RELEASES
     global ESR_NEXT
     global INCLUDE_115
+    global scraper
 
     # Configure logging
     logging.basicConfig(
@@ -734,6 +759,12 @@ def main():
         action="store_true",
         help="Include ESR 115 and older users in the total ADI count (excluded by default)",
     )
+    parser.add_argument(
+        "-hc",
+        "--http-cache",
+        action="store_true",
+        help="Cache HTTP responses on disk for an hour so repeated runs reuse them (requires requests-cache)",
+    )
     args = parser.parse_args()
     INCLUDE_PREVIOUS_DAILIES = args.include_previous_dailies
     INCLUDE_PREVIOUS_BETA = args.include_previous_beta
@@ -741,6 +772,12 @@ def main():
     ESR_NEXT = args.esr_next
     INCLUDE_115 = args.include_115
 
+    if not os.getenv("BMO_API_KEY"):
+        sys.exit("BMO_API_KEY is empty. Please export your BMO key.")
+
+    if args.http_cache:
+        scraper = create_scraper(cache=True)
+
     esr_major_version = thunderbird_esr_major_version()
     # fmt: off
     release_readiness_metrics = create_metrics_dict([
@@ -776,18 +813,38 @@ def main():
     print_versions()
     logger = logging.getLogger(__name__)
 
-    logger.info("\n\nca=== Starting BMO (Bugzilla) Queries ===")
-    for query_type in BMO_QUERY_TYPES:
-        logger.info(f"Querying BMO for {query_type}...")
-        count = bmo_query(query_type)
-        release_readiness_metrics[query_type]["count"] = count
+    # Fetch the ADI document up front so the concurrent STN queries below
+    # all read the cached copy instead of racing to download it.
+    thunderbird_adi_data()
+
+    # The BMO, STN and CSMO queries are independent and network-bound, so
+    # issue them concurrently and report the results in order afterwards.
+    logger.info("\n\n=== Running BMO, STN and CSMO Queries ===")
+    with ThreadPoolExecutor(max_workers=QUERY_WORKERS) as executor:
+        bmo_futures = {
+            query_type: executor.submit(bmo_query, bmo_url(query_type))
+            for query_type in BMO_QUERY_TYPES
+        }
+        stn_futures = {
+            query_type: executor.submit(stn_query, query_type)
+            for query_type in STN_QUERY_TYPES
+        }
+        csmo_futures = {
+            query_type: executor.submit(csmo_query, csmo_url(query_type))
+            for query_type in CSMO_QUERY_TYPES
+        }
+
+    logger.info("\n\n=== BMO (Bugzilla) Query Results ===")
+    for query_type, future in bmo_futures.items():
+        count = future.result()
+        url = bmo_url(query_type, rest_url=False)
+        release_readiness_metrics[query_type].update(count=count, url=url)
         logger.info(f"BMO {query_type}: {count} bugs found")
-        logger.info(f"BMO {query_type} URL: {bmo_url(query_type, rest_url=False)}")
+        logger.info(f"BMO {query_type} URL: {url}")
 
-    logger.info("\n\n=== Starting STN (Stats) Queries ===")
-    for query_type in STN_QUERY_TYPES:
-        logger.info(f"Querying STN for {query_type}...")
-        count = stn_query(query_type)
+    logger.info("\n\n=== STN (Stats) Query Results ===")
+    for query_type, future in stn_futures.items():
+        count = future.result()
         release_readiness_metrics[query_type]["count"] = count
 
         if query_type == "daily-adi":
@@ -805,112 +862,84 @@ def main():
         else:
             logger.info(f"STN {query_type}: {count:,} users")
 
-    logger.info("\n\n=== Starting CSMO (Crash Stats) Queries ===")
-    for query_type in CSMO_QUERY_TYPES:
-        logger.info(f"Querying CSMO for {query_type}...")
-        count = csmo_query(query_type)
-        release_readiness_metrics[query_type]["count"] = count
+    logger.info("\n\n=== CSMO (Crash Stats) Query Results ===")
+    for query_type, future in csmo_futures.items():
+        count = future.result()
+        url = csmo_url(query_type, rest_url=False)
+        release_readiness_metrics[query_type].update(count=count, url=url)
 
         if query_type == "esr140-crashes":
             esr140_versions = thunderbird_current_esr140_versions()
             logger.info(f"CSMO {query_type}: {count} crashes from current ESR 140 versions: {esr140_versions}")
         else:
             logger.info(f"CSMO {query_type}: {count} crashes")
-        logger.info(f"CSMO {query_type} URL: {csmo_url(query_type, rest_url=False)}")
+        logger.info(f"CSMO {query_type} URL: {url}")
 
     # Exclude ESR 115 and older users from total ADI by default
     logger.info("\n\n=== ESR 115 Processing ===")
+    total_adi_metrics = release_readiness_metrics["total-adi"]
+    esr_115_count = thunderbird_esr_count("115")
     if not INCLUDE_115:
-        esr_115_count = thunderbird_esr_count("115")
-        original_total = release_readiness_metrics["total-adi"]["count"]
-        release_readiness_metrics["total-adi"]["count"] -= esr_115_count
+        original_total = total_adi_metrics["count"]
+        total_adi_metrics["count"] -= esr_115_count
         logger.info(f"ESR 115 and older users: {esr_115_count:,} (excluded from total)")
-        logger.info(f"Total ADI: {original_total:,} -> {release_readiness_metrics['total-adi']['count']:,} (after excluding ESR 115)")
+        logger.info(f"Total ADI: {original_total:,} -> {total_adi_metrics['count']:,} (after excluding ESR 115)")
     else:
-        esr_115_count = thunderbird_esr_count("115")
         logger.info(f"ESR 115 and older users: {esr_115_count:,} (included in total)")
-        logger.info(f"Total ADI: {release_readiness_metrics['total-adi']['count']:,}")
+        logger.info(f"Total ADI: {total_adi_metrics['count']:,}")
 
-    # Calculate crash rates based on current versions only
+    # Calculate crash rates based on current versions only. The CSMO crash
+    # counts above are already limited to the current versions, so they are
+    # reused here rather than queried again.
     logger.info("\n\n=== Current Version Crash Rate Calculations ===")
 
-    # Daily crash rate
-    current_daily_versions = thunderbird_current_daily_version()
-    current_daily_adi = stn_current_query("current-daily-adi")
-    current_daily_crashes = csmo_current_query("current-daily-crashes")
-    daily_crash_rate = current_daily_crashes / current_daily_adi if current_daily_adi > 0 else 0
-    logger.info(f"Daily versions: {current_daily_versions}")
-    logger.info(f"Daily ADI (current): {current_daily_adi:,}")
-    logger.info(f"Daily crashes (current): {current_daily_crashes:,}")
-    logger.info(f"Daily crash rate (current): {daily_crash_rate:.6f} ({daily_crash_rate*100:.4f}%)")
-
-    # Beta crash rate
-    current_beta_versions = thunderbird_current_beta_versions()
-    current_beta_adi = stn_current_query("current-beta-adi")
-    current_beta_crashes = csmo_current_query("current-beta-crashes")
-    beta_crash_rate = current_beta_crashes / current_beta_adi if current_beta_adi > 0 else 0
-    logger.info(f"Beta versions: {current_beta_versions}")
-    logger.info(f"Beta ADI (current): {current_beta_adi:,}")
-    logger.info(f"Beta crashes (current): {current_beta_crashes:,}")
-    logger.info(f"Beta crash rate (current): {beta_crash_rate:.6f} ({beta_crash_rate*100:.4f}%)")
-
-    # Release crash rate
-    current_release_versions = thunderbird_current_release_versions()
-    current_release_adi = stn_current_query("current-release-adi")
-    current_release_crashes = csmo_current_query("current-release-crashes")
-    release_crash_rate = current_release_crashes / current_release_adi if current_release_adi > 0 else 0
-    logger.info(f"Release versions: {current_release_versions}")
-    logger.info(f"Release ADI (current): {current_release_adi:,}")
-    logger.info(f"Release crashes (current): {current_release_crashes:,}")
-    logger.info(f"Release crash rate (current): {release_crash_rate:.6f} ({release_crash_rate*100:.4f}%)")
-
-    # Update crash rates to use current version data
-    release_readiness_metrics["daily-crash-rate"]["count"] = daily_crash_rate
-    release_readiness_metrics["beta-crash-rate"]["count"] = beta_crash_rate
-    release_readiness_metrics["release-crash-rate"]["count"] = release_crash_rate
+    for channel, current_versions_function in [
+        ("daily", thunderbird_current_daily_version),
+        ("beta", thunderbird_current_beta_versions),
+        ("release", thunderbird_current_release_versions),
+    ]:
+        current_versions = current_versions_function()
+        current_adi = stn_current_query(f"current-{channel}-adi")
+        current_crashes, crash_rate = set_crash_rate(
+            release_readiness_metrics, channel, current_adi
+        )
+        name = channel.capitalize()
+        logger.info("\n".join([
+            f"{name} versions: {current_versions}",
+            f"{name} ADI (current): {current_adi:,}",
+            f"{name} crashes (current): {current_crashes:,}",
+            f"{name} crash rate (current): {crash_rate:.6f} ({crash_rate*100:.4f}%)",
+        ]))
 
     # Keep the original ADI percentages calculation
     logger.info("\n\n=== ADI Percentage Calculations ===")
-    total_adi = release_readiness_metrics["total-adi"]["count"]
+    total_adi = total_adi_metrics["count"]
     for channel in ["daily", "beta", "release"]:
-        channel_adi = release_readiness_metrics[f"{channel}-adi"]["count"]
-        percentage = channel_adi / total_adi
-        release_readiness_metrics[f"{channel}-adi-%"]["count"] = percentage
+        channel_adi, percentage = set_adi_percentage(
+            release_readiness_metrics, f"{channel}-adi", total_adi
+        )
         logger.info(f"{channel.capitalize()} ADI: {channel_adi:,} / {total_adi:,} = {percentage:.6f} ({percentage*100:.4f}%)")
 
     logger.info("\n\n=== ESR Crash Rate and Percentage Calculations ===")
-    for esr_version in ["140"]:
+    for esr_version, current_versions_function in ESR_CURRENT_VERSIONS.items():
         # Use current minor version crashes but full ESR ADI count
-        current_esr_versions = thunderbird_current_esr140_versions()
+        current_esr_versions = current_versions_function()
         all_esr_versions = thunderbird_esr_versions(esr_version)
-        current_esr140_crashes = csmo_current_esr140_query()
-        esr_adi = release_readiness_metrics[f"esr{esr_version}-adi"]["count"]
-
-        esr_crash_rate = (
-            current_esr140_crashes / esr_adi
-            if esr_adi > 0 else 0
+        esr_adi, esr_percentage = set_adi_percentage(
+            release_readiness_metrics, f"esr{esr_version}-adi", total_adi
         )
-        esr_percentage = esr_adi / total_adi
-
-        logger.info(f"ESR {esr_version} all versions: {all_esr_versions}")
-        logger.info(f"ESR {esr_version} current minor versions: {current_esr_versions}")
-        logger.info(f"ESR {esr_version} ADI (all versions): {esr_adi:,}")
-        logger.info(f"ESR {esr_version} ADI percentage: {esr_percentage:.6f} ({esr_percentage*100:.4f}%)")
-        logger.info(f"ESR {esr_version} crashes (current minor only): {current_esr140_crashes:,}")
-        logger.info(f"ESR {esr_version} crash rate (current minor only): {esr_crash_rate:.6f} ({esr_crash_rate*100:.4f}%)")
-
-        release_readiness_metrics[f"esr{esr_version}-crash-rate"]["count"] = esr_crash_rate
-        release_readiness_metrics[f"esr{esr_version}-adi-%"]["count"] = esr_percentage
-
-    for query_type in BMO_QUERY_TYPES:
-        release_readiness_metrics[query_type]["url"] = bmo_url(
-            query_type, rest_url=False
+        current_esr_crashes, esr_crash_rate = set_crash_rate(
+            release_readiness_metrics, f"esr{esr_version}", esr_adi
         )
 
-    for query_type in CSMO_QUERY_TYPES:
-        release_readiness_metrics[query_type]["url"] = csmo_url(
-            query_type, rest_url=False
-        )
+        logger.info("\n".join([
+            f"ESR {esr_version} all versions: {all_esr_versions}",
+            f"ESR {esr_version} current minor versions: {current_esr_versions}",
+            f"ESR {esr_version} ADI (all versions): {esr_adi:,}",
+            f"ESR {esr_version} ADI percentage: {esr_percentage:.6f} ({esr_percentage*100:.4f}%)",
+            f"ESR {esr_version} crashes (current minor only): {current_esr_crashes:,}",
+            f"ESR {esr_version} crash rate (current minor only): {esr_crash_rate:.6f} ({esr_crash_rate*100:.4f}%)",
+        ]))
 
     logger.info("\n\n=== Summary ===")
     logger.info(f"Total metrics collected: {len(release_readiness_metrics)}")